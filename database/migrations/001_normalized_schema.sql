@@ -4,6 +4,11 @@
 -- This migration drops the old schema and creates the new normalized structure
 -- with videos, comments, and sub_comments tables using YouTube IDs as PKs.
 --
+-- comments and sub_comments are partitioned by channel_id, so their PK is
+-- (channel_id, youtube_comment_id): YouTube comment IDs are unique per
+-- channel only, and ON CONFLICT DO NOTHING skips a re-uploaded comment only
+-- when it is uploaded under the same channel_id.
+--
 -- WARNING: This will DELETE all existing data in comments and sub_comments tables!
 -- Make sure you have a backup before running this migration.
 -- ============================================================================
@@ -41,26 +46,36 @@ CREATE TABLE IF NOT EXISTS videos (
     duration TEXT,
 
     -- Video statistics
-    view_count INTEGER DEFAULT 0,
+    view_count BIGINT DEFAULT 0,
 
     -- Audit field
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- videos is kept across migrations; widen view_count on existing tables
+-- (popular videos pass the 2^31-1 INTEGER limit)
+ALTER TABLE videos ALTER COLUMN view_count TYPE BIGINT;
+
 -- Index for efficient queries filtering by channel
 CREATE INDEX idx_videos_channel_id ON videos(channel_id);
 
 -- ============================================================================
 -- Table: comments
 -- ============================================================================
+-- Partitioned by LIST (channel_id): each channel's comments live in their own
+-- child table (comments_<hash>), so channel-scoped counts/existence checks are
+-- pruned to one partition and clearing a channel is a DROP TABLE instead of a
+-- row-by-row DELETE. Partition keys must be part of the primary key, so the
+-- PK is (channel_id, youtube_comment_id).
+-- ============================================================================
 CREATE TABLE IF NOT EXISTS comments (
-    -- Primary key: YouTube's comment ID (no UUID needed)
-    youtube_comment_id TEXT PRIMARY KEY,
+    -- YouTube's comment ID (no UUID needed)
+    youtube_comment_id TEXT NOT NULL,
 
     -- Foreign key: Reference to parent video
     video_id TEXT NOT NULL,
 
-    -- Channel tracking
+    -- Channel tracking (partition key)
     channel_id TEXT NOT NULL,
 
     -- Comment content and metadata
@@ -71,29 +86,38 @@ CREATE TABLE IF NOT EXISTS comments (
     -- Audit field
     created_at TIMESTAMPTZ DEFAULT NOW(),
 
+    -- Primary key: includes the partition key
+    PRIMARY KEY (channel_id, youtube_comment_id),
+
     -- Foreign key constraint
     CONSTRAINT fk_video
         FOREIGN KEY (video_id)
         REFERENCES videos(youtube_video_id)
         ON DELETE CASCADE
-);
+) PARTITION BY LIST (channel_id);
 
--- Indexes
-CREATE INDEX idx_comments_channel_id ON comments(channel_id);
+-- Catch-all for channels whose partition hasn't been created yet
+CREATE TABLE IF NOT EXISTS comments_default PARTITION OF comments DEFAULT;
+
+-- Indexes (channel_id lookups are served by partition pruning + the PK)
 CREATE INDEX idx_comments_video_id ON comments(video_id);
 
 -- ============================================================================
 -- Table: sub_comments
 -- ============================================================================
+-- Partitioned by LIST (channel_id) like comments. A reply always belongs to
+-- the same channel as its parent, so the parent FK is (channel_id,
+-- parent_comment_id) against the comments PK.
+-- ============================================================================
 CREATE TABLE IF NOT EXISTS sub_comments (
-    -- Primary key: YouTube's reply ID (no UUID needed)
-    youtube_comment_id TEXT PRIMARY KEY,
+    -- YouTube's reply ID (no UUID needed)
+    youtube_comment_id TEXT NOT NULL,
 
     -- Foreign keys
     video_id TEXT NOT NULL,
     parent_comment_id TEXT NOT NULL,
 
-    -- Channel tracking
+    -- Channel tracking (partition key)
     channel_id TEXT NOT NULL,
 
     -- Reply content and metadata
@@ -104,6 +128,9 @@ CREATE TABLE IF NOT EXISTS sub_comments (
     -- Audit field
     created_at TIMESTAMPTZ DEFAULT NOW(),
 
+    -- Primary key: includes the partition key
+    PRIMARY KEY (channel_id, youtube_comment_id),
+
     -- Foreign key constraints
     CONSTRAINT fk_video
         FOREIGN KEY (video_id)
@@ -111,16 +138,120 @@ CREATE TABLE IF NOT EXISTS sub_comments (
         ON DELETE CASCADE,
 
     CONSTRAINT fk_parent_comment
-        FOREIGN KEY (parent_comment_id)
-        REFERENCES comments(youtube_comment_id)
+        FOREIGN KEY (channel_id, parent_comment_id)
+        REFERENCES comments(channel_id, youtube_comment_id)
         ON DELETE CASCADE
-);
+) PARTITION BY LIST (channel_id);
+
+-- Catch-all for channels whose partition hasn't been created yet
+CREATE TABLE IF NOT EXISTS sub_comments_default PARTITION OF sub_comments DEFAULT;
 
 -- Indexes
-CREATE INDEX idx_sub_comments_channel_id ON sub_comments(channel_id);
 CREATE INDEX idx_sub_comments_video_id ON sub_comments(video_id);
 CREATE INDEX idx_sub_comments_parent_id ON sub_comments(parent_comment_id);
 
+-- ============================================================================
+-- Partition management functions
+-- ============================================================================
+-- Partition names use a hash of the channel ID: channel IDs are mixed-case
+-- and contain '-', so a sanitized name could collide between channels.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION channel_partition_suffix(p_channel_id TEXT)
+RETURNS TEXT AS $$
+    SELECT substr(md5(p_channel_id), 1, 16);
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Create the comments/sub_comments partitions for a channel (idempotent).
+-- Called by upload_to_supabase.py before loading a channel. If the default
+-- partition already holds rows for the channel, the partitions are not
+-- created and the channel's rows stay in the default partition.
+CREATE OR REPLACE FUNCTION ensure_channel_partitions(p_channel_id TEXT)
+RETURNS BOOLEAN AS $$
+DECLARE
+    suffix TEXT := channel_partition_suffix(p_channel_id);
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF comments FOR VALUES IN (%L)',
+        'comments_' || suffix, p_channel_id
+    );
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF sub_comments FOR VALUES IN (%L)',
+        'sub_comments_' || suffix, p_channel_id
+    );
+    RETURN TRUE;
+EXCEPTION
+    WHEN check_violation THEN
+        RAISE NOTICE 'Rows for channel % already in default partition', p_channel_id;
+        RETURN FALSE;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Drop a channel's comments/sub_comments partitions, removing all of its rows
+-- without per-row deletes. Returns FALSE if the channel has no partitions.
+CREATE OR REPLACE FUNCTION drop_channel_partitions(p_channel_id TEXT)
+RETURNS BOOLEAN AS $$
+DECLARE
+    suffix TEXT := channel_partition_suffix(p_channel_id);
+BEGIN
+    IF to_regclass('comments_' || suffix) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    -- Replies first: the comments partition can only be detached once no
+    -- rows reference it
+    EXECUTE format('DROP TABLE IF EXISTS %I', 'sub_comments_' || suffix);
+    EXECUTE format('ALTER TABLE comments DETACH PARTITION %I', 'comments_' || suffix);
+    EXECUTE format('DROP TABLE %I', 'comments_' || suffix);
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- The partition functions run DDL as the table owner (SECURITY DEFINER) so
+-- the API role can call them over RPC. Only the service role may do so.
+REVOKE EXECUTE ON FUNCTION ensure_channel_partitions(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION drop_channel_partitions(TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION ensure_channel_partitions(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION drop_channel_partitions(TEXT) TO service_role;
+
+-- ============================================================================
+-- Verification functions
+-- ============================================================================
+-- Called over RPC by scripts/verify_supabase_data.py so each check is a
+-- single round trip.
+-- ============================================================================
+
+-- Row counts for one channel's videos, comments and sub_comments
+CREATE OR REPLACE FUNCTION get_channel_counts(p_channel_id TEXT)
+RETURNS TABLE(videos BIGINT, comments BIGINT, sub_comments BIGINT) AS $$
+    SELECT
+        (SELECT count(*) FROM videos WHERE channel_id = p_channel_id),
+        (SELECT count(*) FROM comments WHERE channel_id = p_channel_id),
+        (SELECT count(*) FROM sub_comments WHERE channel_id = p_channel_id);
+$$ LANGUAGE sql STABLE;
+
+-- Rows whose foreign keys point at missing rows, across all channels
+-- (all zeros when the data is consistent)
+CREATE OR REPLACE FUNCTION fk_orphan_counts()
+RETURNS TABLE(
+    comments_missing_video BIGINT,
+    subs_missing_parent BIGINT,
+    subs_missing_video BIGINT
+) AS $$
+    SELECT
+        (SELECT count(*) FROM comments c
+         WHERE NOT EXISTS (
+             SELECT 1 FROM videos v WHERE v.youtube_video_id = c.video_id)),
+        (SELECT count(*) FROM sub_comments s
+         WHERE NOT EXISTS (
+             SELECT 1 FROM comments c
+             WHERE c.channel_id = s.channel_id
+               AND c.youtube_comment_id = s.parent_comment_id)),
+        (SELECT count(*) FROM sub_comments s
+         WHERE NOT EXISTS (
+             SELECT 1 FROM videos v WHERE v.youtube_video_id = s.video_id));
+$$ LANGUAGE sql STABLE;
+
 -- ============================================================================
 -- Migration Complete
 -- ============================================================================
@@ -131,4 +262,9 @@ CREATE INDEX idx_sub_comments_parent_id ON sub_comments(parent_comment_id);
 --
 --   SELECT indexname, tablename FROM pg_indexes
 --   WHERE tablename IN ('videos', 'comments', 'sub_comments');
+--
+-- List channel partitions:
+--
+--   SELECT inhrelid::regclass FROM pg_inherits
+--   WHERE inhparent IN ('comments'::regclass, 'sub_comments'::regclass);
 -- ============================================================================
@@ -18,6 +18,9 @@ def get_database_url():
     """
     Get PostgreSQL connection URL from Supabase URL.
 
+    Migrations use the direct connection (port 5432) rather than the
+    transaction pooler: DDL scripts need a session-mode connection.
+
     Returns:
         Database connection URL string
     """
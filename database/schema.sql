@@ -16,13 +16,16 @@
 --   - channel_id field to track which YouTube channel the data belongs to
 --   - created_at timestamp to track when records were inserted
 --   - Indexes on channel_id and foreign keys for query performance
+--   - comments and sub_comments are partitioned by LIST (channel_id), one
+--     partition per channel, so channel-scoped queries touch one partition
+--     and a channel can be cleared with DROP TABLE
+--   - Their PK is therefore (channel_id, youtube_comment_id): YouTube comment
+--     IDs are unique per channel, not table-wide
 -- ============================================================================
 
 -- Uncomment these lines for development/testing to drop existing tables:
 -- DROP INDEX IF EXISTS idx_videos_channel_id;
--- DROP INDEX IF EXISTS idx_comments_channel_id;
 -- DROP INDEX IF EXISTS idx_comments_video_id;
--- DROP INDEX IF EXISTS idx_sub_comments_channel_id;
 -- DROP INDEX IF EXISTS idx_sub_comments_video_id;
 -- DROP INDEX IF EXISTS idx_sub_comments_parent_id;
 -- DROP TABLE IF EXISTS sub_comments;
@@ -57,7 +60,7 @@ CREATE TABLE IF NOT EXISTS videos (
     duration TEXT,                        -- ISO 8601 duration (e.g., "PT1H2M10S")
 
     -- Video statistics (from YouTube API statistics)
-    view_count INTEGER DEFAULT 0,        -- Number of views
+    view_count BIGINT DEFAULT 0,        -- Number of views
 
     -- Audit field: When this record was inserted into the database
     created_at TIMESTAMPTZ DEFAULT NOW()
@@ -74,17 +77,23 @@ CREATE INDEX IF NOT EXISTS idx_videos_channel_id ON videos(channel_id);
 --
 -- RELATIONSHIP: video_id references videos.youtube_video_id
 -- This establishes a foreign key relationship to the parent video.
+--
+-- PARTITIONING: LIST (channel_id), one child table per channel
+-- (comments_<hash>, created by ensure_channel_partitions()). The partition
+-- key must be part of the primary key, so the PK is
+-- (channel_id, youtube_comment_id).
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS comments (
-    -- Primary key: YouTube's comment ID (no UUID needed)
-    youtube_comment_id TEXT PRIMARY KEY,
+    -- YouTube's comment ID (no UUID needed)
+    youtube_comment_id TEXT NOT NULL,
 
     -- Foreign key: Reference to parent video
     video_id TEXT NOT NULL,
 
     -- Channel tracking: Which YouTube channel this comment belongs to
     -- Extracted from JSON filename pattern: [CHANNEL_ID]_comments.json
+    -- Also the partition key
     channel_id TEXT NOT NULL,
 
     -- Comment content and metadata (from JSON fields)
@@ -95,15 +104,21 @@ CREATE TABLE IF NOT EXISTS comments (
     -- Audit field: When this record was inserted into the database
     created_at TIMESTAMPTZ DEFAULT NOW(),
 
+    -- Primary key: YouTube's comment ID plus the partition key
+    PRIMARY KEY (channel_id, youtube_comment_id),
+
     -- Foreign key constraint to establish comment-video relationship
     CONSTRAINT fk_video
         FOREIGN KEY (video_id)
         REFERENCES videos(youtube_video_id)
         ON DELETE CASCADE  -- If video deleted, delete comments too
-);
+) PARTITION BY LIST (channel_id);
 
--- Index for efficient queries filtering by channel
-CREATE INDEX IF NOT EXISTS idx_comments_channel_id ON comments(channel_id);
+-- Catch-all partition for channels without their own partition yet
+CREATE TABLE IF NOT EXISTS comments_default PARTITION OF comments DEFAULT;
+
+-- Queries filtering by channel are pruned to the channel's partition and
+-- served by the primary key, so no separate channel_id index is needed
 
 -- Index for efficient lookups by video (used in JOIN queries)
 CREATE INDEX IF NOT EXISTS idx_comments_video_id ON comments(video_id);
@@ -116,14 +131,17 @@ CREATE INDEX IF NOT EXISTS idx_comments_video_id ON comments(video_id);
 --
 -- RELATIONSHIPS:
 --   - video_id references videos.youtube_video_id
---   - parent_comment_id references comments.youtube_comment_id
+--   - (channel_id, parent_comment_id) references comments' primary key
+--     (a reply always belongs to the same channel as its parent)
 -- This establishes proper foreign key relationships between replies, their
 -- parent comments, and the videos they belong to.
+--
+-- PARTITIONING: LIST (channel_id), like comments.
 -- ============================================================================
 
 CREATE TABLE IF NOT EXISTS sub_comments (
-    -- Primary key: YouTube's reply ID (no UUID needed)
-    youtube_comment_id TEXT PRIMARY KEY,
+    -- YouTube's reply ID (no UUID needed)
+    youtube_comment_id TEXT NOT NULL,
 
     -- Foreign key: Reference to parent video
     video_id TEXT NOT NULL,
@@ -133,6 +151,7 @@ CREATE TABLE IF NOT EXISTS sub_comments (
 
     -- Channel tracking: Which YouTube channel this reply belongs to
     -- Extracted from JSON filename pattern: [CHANNEL_ID]_sub_comments.json
+    -- Also the partition key
     channel_id TEXT NOT NULL,
 
     -- Reply content and metadata (from JSON fields)
@@ -143,6 +162,9 @@ CREATE TABLE IF NOT EXISTS sub_comments (
     -- Audit field: When this record was inserted into the database
     created_at TIMESTAMPTZ DEFAULT NOW(),
 
+    -- Primary key: YouTube's reply ID plus the partition key
+    PRIMARY KEY (channel_id, youtube_comment_id),
+
     -- Foreign key constraints to establish relationships
     CONSTRAINT fk_video
         FOREIGN KEY (video_id)
@@ -150,13 +172,13 @@ CREATE TABLE IF NOT EXISTS sub_comments (
         ON DELETE CASCADE,  -- If video deleted, delete replies too
 
     CONSTRAINT fk_parent_comment
-        FOREIGN KEY (parent_comment_id)
-        REFERENCES comments(youtube_comment_id)
+        FOREIGN KEY (channel_id, parent_comment_id)
+        REFERENCES comments(channel_id, youtube_comment_id)
         ON DELETE CASCADE  -- If parent comment deleted, delete replies too
-);
+) PARTITION BY LIST (channel_id);
 
--- Index for efficient queries filtering by channel
-CREATE INDEX IF NOT EXISTS idx_sub_comments_channel_id ON sub_comments(channel_id);
+-- Catch-all partition for channels without their own partition yet
+CREATE TABLE IF NOT EXISTS sub_comments_default PARTITION OF sub_comments DEFAULT;
 
 -- Index for efficient lookups by video (used in JOIN queries)
 CREATE INDEX IF NOT EXISTS idx_sub_comments_video_id ON sub_comments(video_id);
@@ -164,6 +186,108 @@ CREATE INDEX IF NOT EXISTS idx_sub_comments_video_id ON sub_comments(video_id);
 -- Index for efficient lookups by parent comment (used in JOIN queries)
 CREATE INDEX IF NOT EXISTS idx_sub_comments_parent_id ON sub_comments(parent_comment_id);
 
+-- ============================================================================
+-- Partition management functions
+-- ============================================================================
+-- Partition names use a hash of the channel ID: channel IDs are mixed-case
+-- and contain '-', so a sanitized name could collide between channels.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION channel_partition_suffix(p_channel_id TEXT)
+RETURNS TEXT AS $$
+    SELECT substr(md5(p_channel_id), 1, 16);
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Create the comments/sub_comments partitions for a channel (idempotent).
+-- Called by upload_to_supabase.py before loading a channel. If the default
+-- partition already holds rows for the channel, the partitions are not
+-- created and the channel's rows stay in the default partition.
+CREATE OR REPLACE FUNCTION ensure_channel_partitions(p_channel_id TEXT)
+RETURNS BOOLEAN AS $$
+DECLARE
+    suffix TEXT := channel_partition_suffix(p_channel_id);
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF comments FOR VALUES IN (%L)',
+        'comments_' || suffix, p_channel_id
+    );
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF sub_comments FOR VALUES IN (%L)',
+        'sub_comments_' || suffix, p_channel_id
+    );
+    RETURN TRUE;
+EXCEPTION
+    WHEN check_violation THEN
+        RAISE NOTICE 'Rows for channel % already in default partition', p_channel_id;
+        RETURN FALSE;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Drop a channel's comments/sub_comments partitions, removing all of its rows
+-- without per-row deletes. Returns FALSE if the channel has no partitions.
+CREATE OR REPLACE FUNCTION drop_channel_partitions(p_channel_id TEXT)
+RETURNS BOOLEAN AS $$
+DECLARE
+    suffix TEXT := channel_partition_suffix(p_channel_id);
+BEGIN
+    IF to_regclass('comments_' || suffix) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    -- Replies first: the comments partition can only be detached once no
+    -- rows reference it
+    EXECUTE format('DROP TABLE IF EXISTS %I', 'sub_comments_' || suffix);
+    EXECUTE format('ALTER TABLE comments DETACH PARTITION %I', 'comments_' || suffix);
+    EXECUTE format('DROP TABLE %I', 'comments_' || suffix);
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- The partition functions run DDL as the table owner (SECURITY DEFINER) so
+-- the API role can call them over RPC. Only the service role may do so.
+REVOKE EXECUTE ON FUNCTION ensure_channel_partitions(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION drop_channel_partitions(TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION ensure_channel_partitions(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION drop_channel_partitions(TEXT) TO service_role;
+
+-- ============================================================================
+-- Verification functions
+-- ============================================================================
+-- Called over RPC by scripts/verify_supabase_data.py so each check is a
+-- single round trip.
+-- ============================================================================
+
+-- Row counts for one channel's videos, comments and sub_comments
+CREATE OR REPLACE FUNCTION get_channel_counts(p_channel_id TEXT)
+RETURNS TABLE(videos BIGINT, comments BIGINT, sub_comments BIGINT) AS $$
+    SELECT
+        (SELECT count(*) FROM videos WHERE channel_id = p_channel_id),
+        (SELECT count(*) FROM comments WHERE channel_id = p_channel_id),
+        (SELECT count(*) FROM sub_comments WHERE channel_id = p_channel_id);
+$$ LANGUAGE sql STABLE;
+
+-- Rows whose foreign keys point at missing rows, across all channels
+-- (all zeros when the data is consistent)
+CREATE OR REPLACE FUNCTION fk_orphan_counts()
+RETURNS TABLE(
+    comments_missing_video BIGINT,
+    subs_missing_parent BIGINT,
+    subs_missing_video BIGINT
+) AS $$
+    SELECT
+        (SELECT count(*) FROM comments c
+         WHERE NOT EXISTS (
+             SELECT 1 FROM videos v WHERE v.youtube_video_id = c.video_id)),
+        (SELECT count(*) FROM sub_comments s
+         WHERE NOT EXISTS (
+             SELECT 1 FROM comments c
+             WHERE c.channel_id = s.channel_id
+               AND c.youtube_comment_id = s.parent_comment_id)),
+        (SELECT count(*) FROM sub_comments s
+         WHERE NOT EXISTS (
+             SELECT 1 FROM videos v WHERE v.youtube_video_id = s.video_id));
+$$ LANGUAGE sql STABLE;
+
 -- ============================================================================
 -- Schema Creation Complete
 -- ============================================================================
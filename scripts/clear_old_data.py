@@ -26,27 +26,57 @@ try:
     conn = psycopg2.connect(DATABASE_URL)
     cursor = conn.cursor()
 
-    # Count existing records
-    cursor.execute("SELECT COUNT(*) FROM comments WHERE channel_id = %s", (CHANNEL_ID,))
-    comment_count = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM sub_comments WHERE channel_id = %s", (CHANNEL_ID,))
-    sub_comment_count = cursor.fetchone()[0]
+    # Block concurrent writers until commit, so no other channel's rows can
+    # arrive between the check below and the TRUNCATE
+    cursor.execute("LOCK TABLE comments, sub_comments IN ACCESS EXCLUSIVE MODE")
+
+    # Count existing records and check whether any other channel has data
+    # in these tables - all in a single round trip
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM comments WHERE channel_id = %s),
+               (SELECT COUNT(*) FROM sub_comments WHERE channel_id = %s),
+               EXISTS(SELECT 1 FROM comments WHERE channel_id <> %s)
+                   OR EXISTS(SELECT 1 FROM sub_comments WHERE channel_id <> %s)
+    """, (CHANNEL_ID, CHANNEL_ID, CHANNEL_ID, CHANNEL_ID))
+    comment_count, sub_comment_count, has_other_channels = cursor.fetchone()
 
     print(f"\n📊 Current records in database:")
     print(f"   Comments: {comment_count}")
     print(f"   Sub-comments: {sub_comment_count}")
 
-    # Delete sub_comments first (due to FK constraint)
-    print(f"\n🗑️  Deleting sub_comments...")
-    cursor.execute("DELETE FROM sub_comments WHERE channel_id = %s", (CHANNEL_ID,))
-    deleted_subs = cursor.rowcount
-    print(f"   ✅ Deleted {deleted_subs} sub-comments")
+    # Drop this channel's partitions whenever it has them (no per-row WAL,
+    # storage reclaimed immediately)
+    cursor.execute("SELECT drop_channel_partitions(%s)", (CHANNEL_ID,))
+    dropped = cursor.fetchone()[0]
+
+    if dropped:
+        print(f"\n🗑️  Dropped sub_comments and comments partitions")
+        deleted_subs = sub_comment_count
+        deleted_comments = comment_count
+    elif not has_other_channels:
+        # Rows live in the default partition and belong only to this channel -
+        # TRUNCATE both tables in one statement (single WAL record, disk
+        # reclaimed without VACUUM)
+        print(f"\n🗑️  Truncating sub_comments and comments...")
+        cursor.execute("TRUNCATE TABLE sub_comments, comments RESTART IDENTITY CASCADE")
+        deleted_subs = sub_comment_count
+        deleted_comments = comment_count
+    else:
+        # Channel rows share the default partition with other channels -
+        # delete them only, both deletes in one round trip and one snapshot
+        print(f"\n🗑️  Deleting sub_comments and comments...")
+        cursor.execute("""
+            WITH deleted_subs AS (
+                DELETE FROM sub_comments WHERE channel_id = %s RETURNING 1
+            ), deleted_comments AS (
+                DELETE FROM comments WHERE channel_id = %s RETURNING 1
+            )
+            SELECT (SELECT COUNT(*) FROM deleted_subs),
+                   (SELECT COUNT(*) FROM deleted_comments)
+        """, (CHANNEL_ID, CHANNEL_ID))
+        deleted_subs, deleted_comments = cursor.fetchone()
 
-    # Delete comments
-    print(f"\n🗑️  Deleting comments...")
-    cursor.execute("DELETE FROM comments WHERE channel_id = %s", (CHANNEL_ID,))
-    deleted_comments = cursor.rowcount
+    print(f"   ✅ Deleted {deleted_subs} sub-comments")
     print(f"   ✅ Deleted {deleted_comments} comments")
 
     # Commit transaction
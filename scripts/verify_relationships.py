@@ -27,21 +27,50 @@ try:
     conn = psycopg2.connect(DATABASE_URL)
     cursor = conn.cursor()
 
+    # Tests 1, 2, 4 and 5 are computed by one query: the channel's comments
+    # and replies are each scanned once (CTEs referenced more than once are
+    # materialized) instead of once per test
+    cursor.execute("""
+        WITH c AS (
+            SELECT id, youtube_comment_id
+            FROM comments
+            WHERE channel_id = %s
+        ),
+        sc AS (
+            SELECT id, youtube_comment_id, parentcommentid
+            FROM sub_comments
+            WHERE channel_id = %s
+        ),
+        reply_counts AS (
+            SELECT parentcommentid, COUNT(*) as count
+            FROM sc
+            GROUP BY parentcommentid
+        )
+        SELECT
+            (SELECT COUNT(*) FROM c) as comments_total,
+            (SELECT COUNT(youtube_comment_id) FROM c) as comments_with_id,
+            (SELECT COUNT(*) FROM sc) as replies_total,
+            (SELECT COUNT(youtube_comment_id) FROM sc) as replies_with_id,
+            (SELECT COUNT(parentcommentid) FROM reply_counts) as unique_parents,
+            (SELECT COUNT(*) FROM reply_counts rc
+             JOIN c ON rc.parentcommentid = c.youtube_comment_id) as matched_parents,
+            (SELECT COALESCE(SUM(rc.count), 0) FROM reply_counts rc
+             LEFT JOIN c ON rc.parentcommentid = c.youtube_comment_id
+             WHERE c.id IS NULL) as orphaned_count,
+            (SELECT ROUND(AVG(rc.count), 2) FROM reply_counts rc
+             JOIN c ON rc.parentcommentid = c.youtube_comment_id) as avg_replies_per_parent
+    """, (CHANNEL_ID, CHANNEL_ID))
+
+    (comments_total, comments_with_id, replies_total, replies_with_id,
+     unique_parents, matched_parents, orphaned_count, avg_replies) = cursor.fetchone()
+
     # Test 1: Check that youtube_comment_id is populated
     print("\n📊 Test 1: YouTube Comment ID Population")
     print("-" * 70)
 
-    cursor.execute("""
-        SELECT COUNT(*) as total,
-               COUNT(youtube_comment_id) as with_id,
-               COUNT(*) - COUNT(youtube_comment_id) as missing_id
-        FROM comments
-        WHERE channel_id = %s
-    """, (CHANNEL_ID,))
-
-    total, with_id, missing_id = cursor.fetchone()
-    print(f"   Total comments: {total}")
-    print(f"   With YouTube ID: {with_id}")
+    missing_id = comments_total - comments_with_id
+    print(f"   Total comments: {comments_total}")
+    print(f"   With YouTube ID: {comments_with_id}")
     print(f"   Missing YouTube ID: {missing_id}")
 
     if missing_id == 0:
@@ -49,17 +78,9 @@ try:
     else:
         print(f"   ⚠️  Warning: {missing_id} comments missing YouTube IDs")
 
-    cursor.execute("""
-        SELECT COUNT(*) as total,
-               COUNT(youtube_comment_id) as with_id,
-               COUNT(*) - COUNT(youtube_comment_id) as missing_id
-        FROM sub_comments
-        WHERE channel_id = %s
-    """, (CHANNEL_ID,))
-
-    total, with_id, missing_id = cursor.fetchone()
-    print(f"\n   Total sub-comments: {total}")
-    print(f"   With YouTube ID: {with_id}")
+    missing_id = replies_total - replies_with_id
+    print(f"\n   Total sub-comments: {replies_total}")
+    print(f"   With YouTube ID: {replies_with_id}")
     print(f"   Missing YouTube ID: {missing_id}")
 
     if missing_id == 0:
@@ -71,18 +92,7 @@ try:
     print("\n📊 Test 2: Parent-Child Relationship Validation")
     print("-" * 70)
 
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total_replies,
-            COUNT(DISTINCT sc.parentcommentid) as unique_parents,
-            COUNT(DISTINCT c.youtube_comment_id) as matched_parents
-        FROM sub_comments sc
-        LEFT JOIN comments c ON sc.parentcommentid = c.youtube_comment_id
-        WHERE sc.channel_id = %s
-    """, (CHANNEL_ID,))
-
-    total_replies, unique_parents, matched_parents = cursor.fetchone()
-    print(f"   Total replies: {total_replies}")
+    print(f"   Total replies: {replies_total}")
     print(f"   Unique parent IDs referenced: {unique_parents}")
     print(f"   Matched parent comments: {matched_parents}")
 
@@ -127,15 +137,6 @@ try:
     print("\n📊 Test 4: Orphaned Replies Check")
     print("-" * 70)
 
-    cursor.execute("""
-        SELECT COUNT(*) as orphaned_count
-        FROM sub_comments sc
-        LEFT JOIN comments c ON sc.parentcommentid = c.youtube_comment_id
-        WHERE sc.channel_id = %s AND c.id IS NULL
-    """, (CHANNEL_ID,))
-
-    orphaned_count = cursor.fetchone()[0]
-
     if orphaned_count == 0:
         print(f"   ✅ No orphaned replies found!")
     else:
@@ -162,27 +163,9 @@ try:
     print("\n📊 Test 5: Overall Statistics")
     print("-" * 70)
 
-    cursor.execute("""
-        SELECT
-            COUNT(DISTINCT c.id) as total_comments,
-            COUNT(DISTINCT sc.id) as total_replies,
-            COUNT(DISTINCT c.id) FILTER (WHERE EXISTS (
-                SELECT 1 FROM sub_comments sc2
-                WHERE sc2.parentcommentid = c.youtube_comment_id
-            )) as comments_with_replies,
-            ROUND(AVG(reply_counts.count), 2) as avg_replies_per_parent
-        FROM comments c
-        LEFT JOIN sub_comments sc ON c.youtube_comment_id = sc.parentcommentid
-        LEFT JOIN (
-            SELECT parentcommentid, COUNT(*) as count
-            FROM sub_comments
-            WHERE channel_id = %s
-            GROUP BY parentcommentid
-        ) reply_counts ON c.youtube_comment_id = reply_counts.parentcommentid
-        WHERE c.channel_id = %s
-    """, (CHANNEL_ID, CHANNEL_ID))
-
-    total_comments, total_replies, comments_with_replies, avg_replies = cursor.fetchone()
+    total_comments = comments_total
+    total_replies = replies_total - orphaned_count
+    comments_with_replies = matched_parents
 
     print(f"   Total comments: {total_comments}")
     print(f"   Total replies: {total_replies}")
@@ -32,21 +32,21 @@ def print_section(title):
     print(f"{'=' * 70}")
 
 
+def fetch_channel_counts(channel_id: str) -> dict:
+    """Fetch a channel's video, comment and sub-comment counts with one RPC call."""
+    response = supabase.rpc('get_channel_counts', {'p_channel_id': channel_id}).execute()
+    return response.data[0]
+
+
 def verify_row_counts(channel_id: str, expected_videos: int, expected_comments: int, expected_sub_comments: int):
     """Verify row counts match expected values."""
     print_section("Verifying Row Counts")
 
-    # Count videos
-    videos_response = supabase.table('videos').select('youtube_video_id', count='exact').eq('channel_id', channel_id).execute()
-    videos_count = videos_response.count if videos_response.count is not None else 0
-
-    # Count comments
-    comments_response = supabase.table('comments').select('youtube_comment_id', count='exact').eq('channel_id', channel_id).execute()
-    comments_count = comments_response.count if comments_response.count is not None else 0
-
-    # Count sub-comments
-    sub_comments_response = supabase.table('sub_comments').select('youtube_comment_id', count='exact').eq('channel_id', channel_id).execute()
-    sub_comments_count = sub_comments_response.count if sub_comments_response.count is not None else 0
+    # Count videos, comments and sub-comments in one round trip
+    counts = fetch_channel_counts(channel_id)
+    videos_count = counts['videos']
+    comments_count = counts['comments']
+    sub_comments_count = counts['sub_comments']
 
     # Print results
     print(f"\nVideos:")
@@ -70,65 +70,26 @@ def verify_row_counts(channel_id: str, expected_videos: int, expected_comments:
 
 
 def verify_foreign_keys():
-    """Verify foreign key relationships are valid."""
+    """Verify foreign key relationships are valid across all rows."""
     print_section("Verifying Foreign Key Relationships")
 
-    # Check comments → videos FK
-    print("\nChecking comments.video_id → videos.youtube_video_id...")
-    comments_with_video = supabase.table('comments').select('youtube_comment_id, video_id').limit(5).execute()
+    # Count orphaned rows for every FK server-side in one round trip
+    orphans = supabase.rpc('fk_orphan_counts', {}).execute().data[0]
 
-    if comments_with_video.data:
-        print(f"  ✅ Sample comment has video_id: {comments_with_video.data[0]['video_id']}")
+    checks = [
+        ("comments.video_id → videos.youtube_video_id", orphans['comments_missing_video']),
+        ("sub_comments.parent_comment_id → comments.youtube_comment_id", orphans['subs_missing_parent']),
+        ("sub_comments.video_id → videos.youtube_video_id", orphans['subs_missing_video']),
+    ]
 
-        # Verify the video exists
-        video_exists = supabase.table('videos').select('youtube_video_id').eq(
-            'youtube_video_id', comments_with_video.data[0]['video_id']
-        ).execute()
-
-        if video_exists.data:
-            print(f"  ✅ Foreign key valid: Video {comments_with_video.data[0]['video_id']} exists")
+    for label, orphan_count in checks:
+        print(f"\nChecking {label}...")
+        if orphan_count == 0:
+            print("  ✅ Foreign key valid: no orphaned rows")
         else:
-            print(f"  ❌ Foreign key broken: Video {comments_with_video.data[0]['video_id']} not found")
-
-    # Check sub_comments → comments FK
-    print("\nChecking sub_comments.parent_comment_id → comments.youtube_comment_id...")
-    sub_comments_with_parent = supabase.table('sub_comments').select(
-        'youtube_comment_id, parent_comment_id'
-    ).limit(5).execute()
-
-    if sub_comments_with_parent.data:
-        print(f"  ✅ Sample sub-comment has parent_comment_id: {sub_comments_with_parent.data[0]['parent_comment_id']}")
-
-        # Verify the parent comment exists
-        parent_exists = supabase.table('comments').select('youtube_comment_id').eq(
-            'youtube_comment_id', sub_comments_with_parent.data[0]['parent_comment_id']
-        ).execute()
-
-        if parent_exists.data:
-            print(f"  ✅ Foreign key valid: Parent comment {sub_comments_with_parent.data[0]['parent_comment_id']} exists")
-        else:
-            print(f"  ❌ Foreign key broken: Parent comment {sub_comments_with_parent.data[0]['parent_comment_id']} not found")
-
-    # Check sub_comments → videos FK
-    print("\nChecking sub_comments.video_id → videos.youtube_video_id...")
-    if sub_comments_with_parent.data:
-        sub_comment_video_id = supabase.table('sub_comments').select('video_id').eq(
-            'youtube_comment_id', sub_comments_with_parent.data[0]['youtube_comment_id']
-        ).execute()
-
-        if sub_comment_video_id.data:
-            video_id = sub_comment_video_id.data[0]['video_id']
-            print(f"  ✅ Sample sub-comment has video_id: {video_id}")
-
-            # Verify the video exists
-            video_exists = supabase.table('videos').select('youtube_video_id').eq(
-                'youtube_video_id', video_id
-            ).execute()
+            print(f"  ❌ Foreign key broken: {orphan_count} orphaned rows")
 
-            if video_exists.data:
-                print(f"  ✅ Foreign key valid: Video {video_id} exists")
-            else:
-                print(f"  ❌ Foreign key broken: Video {video_id} not found")
+    return all(orphan_count == 0 for _, orphan_count in checks)
 
 
 def verify_sample_queries():
@@ -183,14 +144,12 @@ def verify_sample_queries():
     print("\nQuery 3: Channel statistics")
     channel_id = 'UCOXRjenlq9PmlTqd_JhAbMQ'
 
-    videos_count = supabase.table('videos').select('youtube_video_id', count='exact').eq('channel_id', channel_id).execute()
-    comments_count = supabase.table('comments').select('youtube_comment_id', count='exact').eq('channel_id', channel_id).execute()
-    sub_comments_count = supabase.table('sub_comments').select('youtube_comment_id', count='exact').eq('channel_id', channel_id).execute()
+    counts = fetch_channel_counts(channel_id)
 
     print(f"  Channel ID: {channel_id}")
-    print(f"  Total Videos: {videos_count.count}")
-    print(f"  Total Comments: {comments_count.count}")
-    print(f"  Total Sub-Comments: {sub_comments_count.count}")
+    print(f"  Total Videos: {counts['videos']}")
+    print(f"  Total Comments: {counts['comments']}")
+    print(f"  Total Sub-Comments: {counts['sub_comments']}")
     print(f"  ✅ Statistics retrieved successfully")
 
 
@@ -208,13 +167,13 @@ def main():
     try:
         # Run verifications
         counts_valid = verify_row_counts(channel_id, expected_videos, expected_comments, expected_sub_comments)
-        verify_foreign_keys()
+        foreign_keys_valid = verify_foreign_keys()
         verify_sample_queries()
 
         # Final summary
         print_section("Verification Summary")
 
-        if counts_valid:
+        if counts_valid and foreign_keys_valid:
             print("\n✅ All verifications passed!")
             print("   - Row counts match expected values")
             print("   - Foreign key relationships are valid")
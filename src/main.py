@@ -11,13 +11,22 @@ It supports resumable operation and saves comments to JSON files in the output d
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-import json
 import os
+import re
 import tempfile
+import threading
 import time
 import random
 import argparse
+from collections import deque
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from operator import itemgetter
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
+import ijson
+import orjson
 from tqdm import tqdm
 from dotenv import load_dotenv
 
@@ -36,6 +45,11 @@ CONFIG = {
     'max_results_videos': 50,            # Videos per API call (max 50 per YouTube API)
     'max_results_comments': 100,         # Comments per API call (max 100 per YouTube API)
     'retry_attempts': 3,                 # Number of retry attempts for rate limiting
+    'backoff_base_seconds': 1,           # Upper bound of the first retry delay (doubles per attempt)
+    'backoff_cap_seconds': 60,           # Longest delay between retries
+    'video_workers': 4,                  # Videos whose comments are fetched concurrently
+    'reply_workers': 8,                  # Reply threads fetched concurrently (shared by all videos)
+    'checkpoint_every': 25,              # Videos fetched between saves (also saved on exit)
     'api_version': 'v3',                 # YouTube Data API version
     'daily_quota_limit': 10000           # Default daily quota limit in units
 }
@@ -91,6 +105,28 @@ except Exception as e:
     print("Please verify your API key is valid and YouTube Data API v3 is enabled in Google Cloud Console")
     raise
 
+# Per-thread service objects for the worker threads
+# The underlying httplib2 connection is not thread-safe, so every worker
+# thread builds (once) and reuses its own service object
+_thread_local = threading.local()
+
+
+def get_youtube_client():
+    """
+    Return the YouTube API service object for the current thread.
+
+    The service object is built on a thread's first call and reused for all
+    of that thread's later requests, so its connection stays open between them.
+
+    Returns:
+        Resource: YouTube Data API v3 service object owned by this thread
+    """
+    client = getattr(_thread_local, 'youtube', None)
+    if client is None:
+        client = build("youtube", CONFIG['api_version'], developerKey=API_KEY)
+        _thread_local.youtube = client
+    return client
+
 
 # ============================================================================
 # QUOTA TRACKING
@@ -99,6 +135,7 @@ except Exception as e:
 # Global quota usage tracker
 # YouTube Data API v3 has a default quota of 10,000 units per day
 quota_used = 0
+quota_lock = threading.Lock()  # Worker threads update quota_used concurrently
 
 # API operation costs in quota units
 QUOTA_COSTS = {
@@ -131,8 +168,9 @@ def track_quota(operation_type):
     """
     global quota_used
     cost = QUOTA_COSTS.get(operation_type, 0)
-    quota_used += cost
-    return quota_used
+    with quota_lock:
+        quota_used += cost
+        return quota_used
 
 
 # ============================================================================
@@ -141,10 +179,11 @@ def track_quota(operation_type):
 
 def parse_http_error_reason(http_error):
     """
-    Extract the reason from an HttpError by parsing its content.
+    Extract the reason from an HttpError.
 
-    The HttpError object contains a content attribute with JSON-encoded error details.
-    This function safely parses the content and extracts the error reason.
+    googleapiclient already decodes the error body when the HttpError is raised and
+    keeps the "errors" list in error_details, so that is used when present. Otherwise
+    the JSON-encoded content attribute is parsed safely.
 
     Parameters:
         http_error (HttpError): The HttpError exception object
@@ -152,17 +191,65 @@ def parse_http_error_reason(http_error):
     Returns:
         str or None: The error reason (e.g., 'commentsDisabled', 'quotaExceeded') or None if not found
     """
+    # error_details holds error.errors (entries carry a "domain") unless the body
+    # also has a "details" list, in which case fall back to parsing the content
+    error_details = getattr(http_error, 'error_details', None)
+    if (isinstance(error_details, list) and error_details
+            and isinstance(error_details[0], dict) and 'domain' in error_details[0]):
+        return error_details[0].get('reason')
+
+    content = getattr(http_error, 'content', None)
+    if not content:
+        return None
+
     try:
-        error_content = json.loads(http_error.content)
-        errors = error_content.get('error', {}).get('errors', [{}])
-        if errors:
-            return errors[0].get('reason')
+        error_content = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+
+    # Walk the structure with early returns instead of throwaway defaults
+    if not isinstance(error_content, dict):
+        return None
+    error = error_content.get('error')
+    if not isinstance(error, dict):
+        return None
+    errors = error.get('errors')
+    if not errors or not isinstance(errors[0], dict):
         return None
-    except (json.JSONDecodeError, AttributeError, IndexError, KeyError):
+    return errors[0].get('reason')
+
+
+def retry_after_seconds(http_error):
+    """
+    Read the delay requested by a Retry-After header on an HttpError, if any.
+
+    The header may hold either a number of seconds or an HTTP date.
+
+    Parameters:
+        http_error (HttpError): The HttpError exception object
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is absent or invalid
+    """
+    resp = getattr(http_error, 'resp', None)
+    value = resp.get('retry-after') if resp is not None else None
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
         return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
-def api_call_with_retry(api_func, operation_type=None, max_retries=None):
+def api_call_with_retry(api_method, operation_type=None, max_retries=None, **params):
     """
     Execute an API call with exponential backoff retry logic for transient errors.
 
@@ -171,9 +258,10 @@ def api_call_with_retry(api_func, operation_type=None, max_retries=None):
     best practices for handling transient failures. Also tracks quota usage.
 
     Parameters:
-        api_func (callable): A function that makes an API call and returns the response
+        api_method (callable): A bound API method such as youtube.commentThreads().list
         operation_type (str): The API operation type for quota tracking (e.g., 'channels.list')
         max_retries (int): Maximum number of retry attempts (default: from CONFIG)
+        **params: Request parameters passed to api_method on every attempt
 
     Returns:
         dict: The API response from the successful call
@@ -184,8 +272,10 @@ def api_call_with_retry(api_func, operation_type=None, max_retries=None):
 
     Example:
         response = api_call_with_retry(
-            lambda: youtube.commentThreads().list(videoId=video_id, part="snippet").execute(),
-            operation_type='commentThreads.list'
+            youtube.commentThreads().list,
+            operation_type='commentThreads.list',
+            videoId=video_id,
+            part="snippet"
         )
     """
     if max_retries is None:
@@ -193,7 +283,7 @@ def api_call_with_retry(api_func, operation_type=None, max_retries=None):
 
     for attempt in range(max_retries):
         try:
-            result = api_func()
+            result = api_method(**params).execute()
             # Track quota usage on successful call
             if operation_type:
                 track_quota(operation_type)
@@ -202,9 +292,17 @@ def api_call_with_retry(api_func, operation_type=None, max_retries=None):
             # Check if this is a retryable error (rate limit or service unavailable)
             if e.resp.status in [429, 503]:
                 if attempt < max_retries - 1:
-                    # Calculate exponential backoff with jitter
-                    # Formula: (2^attempt) + random(0, 1)
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
+                    # Honor the server's Retry-After if given; otherwise use
+                    # exponential backoff with "full jitter":
+                    # random(0, min(cap, base * 2^attempt))
+                    # Spreading retries over the whole window keeps concurrent
+                    # workers from retrying in lockstep
+                    wait_time = retry_after_seconds(e)
+                    if wait_time is None:
+                        wait_time = random.uniform(0, min(
+                            CONFIG['backoff_cap_seconds'],
+                            CONFIG['backoff_base_seconds'] * (2 ** attempt)
+                        ))
                     print(f"⚠️  Rate limited or service unavailable. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
                     time.sleep(wait_time)
                 else:
@@ -239,6 +337,11 @@ def create_video_link(video_id):
     return f"https://www.youtube.com/watch?v={video_id}"
 
 
+# Flush file contents without forcing an extra metadata (mtime) journal commit
+# where the platform supports it; macOS and Windows lack fdatasync
+fsync_data = getattr(os, 'fdatasync', os.fsync)
+
+
 def atomic_write_json(file_path, data):
     """
     Atomically write JSON data to a file using a temporary file and os.replace().
@@ -257,24 +360,242 @@ def atomic_write_json(file_path, data):
     # This ensures the temp file is on the same filesystem for atomic replacement
     dir_path = os.path.dirname(file_path)
 
-    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', dir=dir_path, delete=False) as temp_file:
-        temp_path = temp_file.name
-        try:
-            # Write the JSON data to the temporary file
-            json.dump(data, temp_file, ensure_ascii=False, indent=2)
+    # mkstemp opens the file with O_CREAT | O_EXCL and returns the raw
+    # descriptor, so no NamedTemporaryFile wrapper or finalizer is involved
+    fd, temp_path = tempfile.mkstemp(dir=dir_path, prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as temp_file:
+            # Serialize with orjson (native code, UTF-8 output like ensure_ascii=False)
+            temp_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             temp_file.flush()
-            os.fsync(temp_file.fileno())
-        except Exception as e:
-            # Clean up the temporary file if writing fails
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
-            raise e
+            fsync_data(temp_file.fileno())
+
+        # Atomically replace the target file with the temporary file
+        # os.replace() is atomic on both POSIX and Windows systems
+        os.replace(temp_path, file_path)
+    except Exception:
+        # Clean up the temporary file if writing fails
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
 
-    # Atomically replace the target file with the temporary file
-    # os.replace() is atomic on both POSIX and Windows systems
-    os.replace(temp_path, file_path)
+
+def append_jsonl(file_path, records):
+    """
+    Append records to a JSON Lines file, one JSON object per line.
+
+    Only the new records are written, so each save costs O(new records)
+    instead of re-serializing the whole file. All records are written with a
+    single write and one fsync.
+
+    Parameters:
+        file_path (str): The JSONL file to append to (created if missing)
+        records (list of dict): The records to append
+    """
+    if not records:
+        return
+
+    payload = b''.join(
+        orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records
+    )
+    with open(file_path, 'ab') as f:
+        f.write(payload)
+        f.flush()
+        fsync_data(f.fileno())
+
+
+# Channel IDs resolved from handles, custom names and usernames, keyed by
+# "[KIND]/[lowercased name]"; loaded from disk on first use (see below)
+channel_id_cache = None
+
+
+def get_channel_id_cache_file():
+    """Return the path of the on-disk channel ID cache in the output directory."""
+    # Earlier versions wrote unverified search matches to .channel_id_cache.json;
+    # a new file name keeps those entries from being reused
+    return f"{CONFIG['output_dir']}/.channel_ids.json"
+
+
+def channel_custom_url_matches(channel_id, name):
+    """
+    Check that a channel found by search really owns the handle or custom name.
+
+    search.list returns the best fuzzy match for a query, which isn't always
+    the channel that was asked for. The channel's customUrl ("@handle", or the
+    legacy custom name) is compared with the name instead (1 quota unit).
+
+    Parameters:
+        channel_id (str): Channel ID returned by search
+        name (str): The handle (without @) or custom name that was searched for
+
+    Returns:
+        bool: True if the channel's customUrl matches the name
+    """
+    response = api_call_with_retry(
+        youtube.channels().list,
+        operation_type='channels.list',
+        part="snippet",
+        id=channel_id
+    )
+
+    items = response.get('items') or []
+    if not items:
+        return False
+    custom_url = items[0]['snippet'].get('customUrl', '')
+    return custom_url.lower().lstrip('@') == name.lower().lstrip('@')
+
+
+def cached_channel_lookup(kind, verify=None):
+    """
+    Decorator caching a name -> channel ID resolver on disk.
+
+    Channel IDs never change, so an exact resolution is cached forever.
+    Re-running the script for the same @handle or /c/ URL then costs no API
+    call, which matters most for search.list at 100 quota units per lookup.
+    Resolutions from a fuzzy search are only cached once `verify` confirms
+    them; an unconfirmed match is used for this run only, so a wrong guess is
+    never made permanent. The cache is a small JSON object in the output
+    directory, rewritten atomically on each new entry.
+
+    Parameters:
+        kind (str): Lookup kind used in the cache key (e.g. 'handle', 'c', 'user')
+        verify (callable, optional): Function (channel_id, name) -> bool that
+            must return True for the resolution to be cached
+
+    Returns:
+        callable: Decorator for a function taking a name and returning a channel ID
+    """
+    def decorator(resolve):
+        @wraps(resolve)
+        def wrapper(name):
+            global channel_id_cache
+            cache_file = get_channel_id_cache_file()
+
+            if channel_id_cache is None:
+                try:
+                    with open(cache_file, 'rb') as f:
+                        channel_id_cache = orjson.loads(f.read())
+                except (FileNotFoundError, orjson.JSONDecodeError):
+                    channel_id_cache = {}
+
+            key = f"{kind}/{name.lower()}"
+            if key in channel_id_cache:
+                return channel_id_cache[key]
+
+            channel_id = resolve(name)
+            if verify is not None and not verify(channel_id, name):
+                print(f"Warning: '{name}' resolved by search to {channel_id}, "
+                      f"which doesn't list it as its URL; not caching this match")
+                return channel_id
+
+            channel_id_cache[key] = channel_id
+            atomic_write_json(cache_file, channel_id_cache)
+            return channel_id
+        return wrapper
+    return decorator
+
+
+@cached_channel_lookup('handle', verify=channel_custom_url_matches)
+def resolve_channel_handle(username):
+    """
+    Resolve a channel handle (the part after @) to its channel ID via search.
+
+    Parameters:
+        username (str): The handle without the leading @
+
+    Returns:
+        str: The channel ID
+
+    Raises:
+        ValueError: If no channel is found for the handle
+    """
+    response = api_call_with_retry(
+        youtube.search().list,
+        operation_type='search.list',
+        part="snippet",
+        q=f"@{username}",
+        type="channel",
+        maxResults=1
+    )
+
+    if 'items' in response and len(response['items']) > 0:
+        return response['items'][0]['snippet']['channelId']
+    raise ValueError(f"Channel not found for handle: @{username}")
+
+
+@cached_channel_lookup('c', verify=channel_custom_url_matches)
+def resolve_custom_name(custom_name):
+    """
+    Resolve a custom URL name (/c/CustomName) to its channel ID via search.
+
+    Parameters:
+        custom_name (str): The custom channel name
+
+    Returns:
+        str: The channel ID
+
+    Raises:
+        ValueError: If no channel is found for the name
+    """
+    response = api_call_with_retry(
+        youtube.search().list,
+        operation_type='search.list',
+        part="snippet",
+        q=custom_name,
+        type="channel",
+        maxResults=1
+    )
+
+    if 'items' in response and len(response['items']) > 0:
+        return response['items'][0]['snippet']['channelId']
+    raise ValueError(f"Channel not found for custom name: {custom_name}")
+
+
+@cached_channel_lookup('user')
+def resolve_username(username):
+    """
+    Resolve a legacy username (/user/username) to its channel ID.
+
+    Parameters:
+        username (str): The legacy YouTube username
+
+    Returns:
+        str: The channel ID
+
+    Raises:
+        ValueError: If no channel is found for the username
+    """
+    response = api_call_with_retry(
+        youtube.channels().list,
+        operation_type='channels.list',
+        part="id",
+        forUsername=username
+    )
+
+    if 'items' in response and len(response['items']) > 0:
+        return response['items'][0]['id']
+    raise ValueError(f"Channel not found for username: {username}")
+
+
+# Channel URL path prefix -> function turning the next path segment into a channel ID
+# (@handle URLs have no prefix segment and are dispatched separately)
+CHANNEL_PATH_HANDLERS = {
+    'channel': lambda channel_id: channel_id,   # /channel/CHANNEL_ID
+    'c': resolve_custom_name,                  # /c/CustomName
+    'user': resolve_username,                  # /user/username
+}
+
+# YouTube channel IDs are 24 URL-safe characters (e.g. UC + 22 characters)
+CHANNEL_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{24}')
+
+# Common URL prefixes whose path can be sliced off directly (no urlparse needed)
+YOUTUBE_URL_PREFIXES = (
+    'https://www.youtube.com/',
+    'https://youtube.com/',
+    'https://m.youtube.com/',
+)
 
 
 def get_channel_id_from_url(url):
@@ -297,83 +618,39 @@ def get_channel_id_from_url(url):
         ValueError: If URL is invalid or channel cannot be found
     """
     try:
-        # Parse the URL to extract components
-        parsed_url = urlparse(url)
+        # Fast path: slice the path straight off a well-formed https URL
+        if url.startswith(YOUTUBE_URL_PREFIXES):
+            path = url.split('/', 3)[3].split('?', 1)[0].split('#', 1)[0]
+        else:
+            # Parse the URL to extract components
+            parsed_url = urlparse(url)
+
+            # Validate that this is a YouTube URL
+            if parsed_url.netloc not in ['www.youtube.com', 'youtube.com', 'm.youtube.com']:
+                raise ValueError(f"Invalid YouTube URL: {url}")
 
-        # Validate that this is a YouTube URL
-        if parsed_url.netloc not in ['www.youtube.com', 'youtube.com', 'm.youtube.com']:
-            raise ValueError(f"Invalid YouTube URL: {url}")
+            path = parsed_url.path
 
-        # Extract the path and split into segments
-        path = parsed_url.path.strip('/')
-        path_segments = path.split('/')
+        # Split the path into segments
+        path_segments = path.strip('/').split('/')
 
         if len(path_segments) < 1:
             raise ValueError(f"Invalid YouTube channel URL format: {url}")
 
-        # Handle direct channel ID format: /channel/CHANNEL_ID
-        if path_segments[0] == 'channel' and len(path_segments) >= 2:
-            return path_segments[1]
-
         # Handle @username format: /@username
-        if path_segments[0].startswith('@'):
-            username = path_segments[0][1:]  # Remove the @ symbol
-            # Use YouTube API to search for the channel by handle
-            response = api_call_with_retry(
-                lambda: youtube.search().list(
-                    part="snippet",
-                    q=f"@{username}",
-                    type="channel",
-                    maxResults=1
-                ).execute(),
-                operation_type='search.list'
-            )
-
-            if 'items' in response and len(response['items']) > 0:
-                return response['items'][0]['snippet']['channelId']
-            else:
-                raise ValueError(f"Channel not found for handle: @{username}")
-
-        # Handle custom URL format: /c/CustomName
-        if path_segments[0] == 'c' and len(path_segments) >= 2:
-            custom_name = path_segments[1]
-            # Use YouTube API to search for the channel
-            response = api_call_with_retry(
-                lambda: youtube.search().list(
-                    part="snippet",
-                    q=custom_name,
-                    type="channel",
-                    maxResults=1
-                ).execute(),
-                operation_type='search.list'
-            )
-
-            if 'items' in response and len(response['items']) > 0:
-                return response['items'][0]['snippet']['channelId']
-            else:
-                raise ValueError(f"Channel not found for custom name: {custom_name}")
-
-        # Handle legacy user format: /user/username
-        if path_segments[0] == 'user' and len(path_segments) >= 2:
-            username = path_segments[1]
-            # Use YouTube API channels().list with forUsername parameter
-            response = api_call_with_retry(
-                lambda: youtube.channels().list(
-                    part="id",
-                    forUsername=username
-                ).execute(),
-                operation_type='channels.list'
-            )
+        first_segment = path_segments[0]
+        if first_segment.startswith('@'):
+            return resolve_channel_handle(first_segment[1:])
 
-            if 'items' in response and len(response['items']) > 0:
-                return response['items'][0]['id']
-            else:
-                raise ValueError(f"Channel not found for username: {username}")
+        # Handle /channel/CHANNEL_ID, /c/CustomName and /user/username
+        handler = CHANNEL_PATH_HANDLERS.get(first_segment)
+        if handler is not None and len(path_segments) >= 2:
+            return handler(path_segments[1])
 
         # Fallback: try treating the last path segment as a potential channel ID
         # This handles edge cases where the URL might be malformed but still contains a valid ID
         potential_id = path_segments[-1]
-        if potential_id and len(potential_id) == 24:  # YouTube channel IDs are typically 24 characters
+        if CHANNEL_ID_PATTERN.fullmatch(potential_id):
             return potential_id
 
         raise ValueError(f"Unable to extract channel ID from URL: {url}")
@@ -406,16 +683,17 @@ def load_videos_state(videos_file):
     """
     if os.path.exists(videos_file):
         try:
-            with open(videos_file, 'r', encoding='utf-8') as f:
-                existing_videos = json.load(f)
+            with open(videos_file, 'rb') as f:
+                existing_videos = orjson.loads(f.read())
 
             # Extract all youtubeVideoId values from existing videos to create a set of processed videos
-            # Each video object has a 'youtubeVideoId' field (YouTube video ID)
-            processed_videos_set = set(video['youtubeVideoId'] for video in existing_videos)
+            # Each video object has a 'youtubeVideoId' field (YouTube video ID);
+            # map + itemgetter runs the whole extraction loop in C
+            processed_videos_set = set(map(itemgetter('youtubeVideoId'), existing_videos))
 
             return processed_videos_set, existing_videos
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             # If JSON is corrupted or structure is invalid, log warning and start fresh
             print(f"Warning: Could not parse existing videos file: {e}")
             print("Starting with fresh state...")
@@ -425,63 +703,128 @@ def load_videos_state(videos_file):
         return set(), []
 
 
-def load_comments_state(comments_file):
+def save_progress(videos_file, videos, comments_file, pending_comments,
+                  sub_comments_file, pending_sub_comments):
     """
-    Load existing comments from file to support resumability.
+    Checkpoint extraction progress to disk.
 
-    This function reads the existing comments JSON file (if it exists) and returns
-    the list of comment objects for appending new comments.
+    Pending comments and replies are appended to their JSONL files first, then
+    the videos file is rewritten atomically; a video only counts as processed
+    once it is in the videos file, so an interruption between the two steps
+    is repaired on the next run (see load_jsonl_state()). The pending lists
+    are cleared once written.
 
     Parameters:
-        comments_file (str): Path to the [CHANNEL_ID]_comments.json file
+        videos_file (str): Path to the [CHANNEL_ID]_videos.json file
+        videos (list of dict): All processed videos
+        comments_file (str): Path to the [CHANNEL_ID]_comments.jsonl file
+        pending_comments (list of dict): Comments not yet written
+        sub_comments_file (str): Path to the [CHANNEL_ID]_sub_comments.jsonl file
+        pending_sub_comments (list of dict): Sub-comments not yet written
+    """
+    append_jsonl(comments_file, pending_comments)
+    append_jsonl(sub_comments_file, pending_sub_comments)
+    atomic_write_json(videos_file, videos)
+    pending_comments.clear()
+    pending_sub_comments.clear()
 
-    Returns:
-        list: List of existing comment dictionaries (empty list if file doesn't exist)
+
+def migrate_json_array_to_jsonl(json_file, jsonl_file):
     """
-    if os.path.exists(comments_file):
-        try:
-            with open(comments_file, 'r', encoding='utf-8') as f:
-                existing_comments = json.load(f)
-            return existing_comments
-
-        except json.JSONDecodeError as e:
-            # If JSON is corrupted, log warning and start fresh
-            print(f"Warning: Could not parse existing comments file: {e}")
-            print("Starting with fresh comments state...")
-            return []
-    else:
-        # File doesn't exist - this is the first run
-        return []
+    Convert a comments file from an older run (one JSON array) to JSON Lines.
 
+    Earlier versions stored comments and sub-comments as a single JSON array
+    that was rewritten after every video. The array is streamed with ijson, so
+    it is never fully loaded, written to a temporary file, and only then swapped
+    in for the JSONL file and the old array removed.
 
-def load_sub_comments(sub_comments_file):
+    Parameters:
+        json_file (str): Path to the legacy [CHANNEL_ID]_*comments.json file
+        jsonl_file (str): Path to the [CHANNEL_ID]_*comments.jsonl file to create
+    """
+    if not os.path.exists(json_file) or os.path.exists(jsonl_file):
+        return
+
+    temp_path = f"{jsonl_file}.tmp"
+    try:
+        with open(json_file, 'rb') as src, open(temp_path, 'wb') as dst:
+            for record in ijson.items(src, 'item', use_float=True):
+                dst.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            dst.flush()
+            fsync_data(dst.fileno())
+    except (ijson.JSONError, OSError) as e:
+        # Leave the legacy file untouched; the run starts a fresh JSONL file
+        print(f"Warning: Could not convert {json_file} to JSON Lines: {e}")
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        return
+
+    os.replace(temp_path, jsonl_file)
+    os.unlink(json_file)
+    print(f"Converted {json_file} to {jsonl_file}")
+
+
+def load_jsonl_state(jsonl_file, processed_videos_set):
     """
-    Load existing sub-comments (replies) from JSON file to support resumability.
+    Count the records already saved in a JSONL file to support resumability.
 
-    This function reads the existing sub-comments file and returns the list
-    of sub-comment objects. Unlike load_state(), this doesn't create a processed
-    videos set because resumption logic is based on top-level comments only.
+    A video's comments are appended before the video is recorded in the videos
+    file, so records at the end of the file whose video is not in
+    processed_videos_set belong to a video that was interrupted mid-save (as
+    does a torn last line). That video is fetched again on this run, so the
+    trailing run of such records after the last record of a processed video
+    is truncated instead of being duplicated. Records before that point are
+    always kept.
+
+    If the file holds no record of a processed video (e.g. the videos file
+    is missing), nothing in it can be told apart from an interrupted save, so
+    the file is moved aside instead of being truncated.
+
+    The file is read one line at a time; records are not kept in memory.
 
     Parameters:
-        sub_comments_file (str): Path to the [CHANNEL_ID]_sub_comments.json file
+        jsonl_file (str): Path to the [CHANNEL_ID]_comments.jsonl or
+            [CHANNEL_ID]_sub_comments.jsonl file
+        processed_videos_set (set): Video IDs already recorded in the videos file
 
     Returns:
-        list: List of existing sub-comment dictionaries (empty list if file doesn't exist)
+        int: Number of saved records (0 if the file doesn't exist)
     """
-    if os.path.exists(sub_comments_file):
-        try:
-            with open(sub_comments_file, 'r', encoding='utf-8') as f:
-                existing_sub_comments = json.load(f)
-            return existing_sub_comments
-
-        except json.JSONDecodeError as e:
-            # If JSON is corrupted, log warning and start fresh
-            print(f"Warning: Could not parse existing sub-comments file: {e}")
-            print("Starting with fresh sub-comments state...")
-            return []
-    else:
+    if not os.path.exists(jsonl_file):
         # File doesn't exist - this is the first run
-        return []
+        return 0
+
+    count = 0
+    valid_count = 0
+    offset = 0
+    valid_end = 0
+
+    with open(jsonl_file, 'r+b') as f:
+        for line in f:
+            offset += len(line)
+            if not line.strip():
+                continue
+            count += 1
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if record.get('videoId') in processed_videos_set:
+                valid_count = count
+                valid_end = offset
+
+        size = os.fstat(f.fileno()).st_size
+        if valid_end and valid_end < size:
+            print(f"Warning: Discarding unfinished records at the end of {jsonl_file}")
+            f.truncate(valid_end)
+
+    if size and not valid_end:
+        backup_file = f"{jsonl_file}.{datetime.now().strftime('%Y%m%d%H%M%S')}.orphaned"
+        os.replace(jsonl_file, backup_file)
+        print(f"Warning: No record in {jsonl_file} belongs to a processed video; moved it to {backup_file}")
+        return 0
+
+    return valid_count
 
 
 def get_uploads_playlist_id(youtube, channel_id):
@@ -510,11 +853,10 @@ def get_uploads_playlist_id(youtube, channel_id):
         # Query the YouTube API for channel content details
         # part="contentDetails" retrieves the section containing related playlists
         response = api_call_with_retry(
-            lambda: youtube.channels().list(
-                part="contentDetails",
-                id=channel_id
-            ).execute(),
-            operation_type='channels.list'
+            youtube.channels().list,
+            operation_type='channels.list',
+            part="contentDetails",
+            id=channel_id
         )
 
         # Verify that the channel exists and returned data
@@ -569,11 +911,13 @@ def fetch_videos_metadata(youtube, video_ids):
 
         # Query the YouTube API for video details
         response = api_call_with_retry(
-            lambda: youtube.videos().list(
-                part="snippet,contentDetails,statistics",
-                id=video_ids_str
-            ).execute(),
-            operation_type='videos.list'
+            youtube.videos().list,
+            operation_type='videos.list',
+            part="snippet,contentDetails,statistics",
+            id=video_ids_str,
+            # Partial response: only the fields copied into videos_metadata below
+            fields="items(id,snippet(title,description,tags,publishedAt,channelTitle),"
+                   "contentDetails/duration,statistics/viewCount)"
         )
 
         # Build dictionary mapping video ID to metadata
@@ -634,6 +978,7 @@ def get_all_videos(youtube, playlist_id):
         Exception: For API-related errors during video retrieval
     """
     videos = []  # Accumulator for all video data
+    list_playlist_items = youtube.playlistItems().list  # Bound once for the pagination loop
     next_page_token = None  # Pagination cursor (None for first page)
 
     try:
@@ -641,20 +986,17 @@ def get_all_videos(youtube, playlist_id):
         while True:
             # Query the YouTube API for a page of playlist items
             response = api_call_with_retry(
-                lambda: youtube.playlistItems().list(
-                    part="snippet",  # Retrieve basic video metadata
-                    playlistId=playlist_id,  # Specify which playlist to query
-                    maxResults=CONFIG['max_results_videos'],  # Fetch maximum items per page
-                    pageToken=next_page_token  # Pagination cursor (None for first page)
-                ).execute(),
-                operation_type='playlistItems.list'
+                list_playlist_items,
+                operation_type='playlistItems.list',
+                part="snippet",  # Retrieve basic video metadata
+                playlistId=playlist_id,  # Specify which playlist to query
+                maxResults=CONFIG['max_results_videos'],  # Fetch maximum items per page
+                pageToken=next_page_token,  # Pagination cursor (None for first page)
+                fields="nextPageToken,items/snippet/resourceId/videoId"  # Partial response
             )
 
             # Extract video IDs from current page
-            video_ids = []
-            for item in response['items']:
-                video_id = item['snippet']['resourceId']['videoId']
-                video_ids.append(video_id)
+            video_ids = [item['snippet']['resourceId']['videoId'] for item in response['items']]
 
             # Fetch comprehensive metadata for this batch of videos
             if video_ids:
@@ -678,7 +1020,7 @@ def get_all_videos(youtube, playlist_id):
         raise Exception(f"Error fetching videos from playlist {playlist_id}: {str(e)}")
 
 
-def fetch_video_comments(youtube, video_id):
+def fetch_video_comments(youtube, video_id, on_thread_with_replies=None):
     """
     Retrieve all top-level comments for a specific video using pagination.
 
@@ -689,12 +1031,19 @@ def fetch_video_comments(youtube, video_id):
     The function uses cursor-based pagination to handle videos with large numbers of comments,
     fetching up to 100 comments per API call (the maximum allowed by the API).
 
+    Threads are requested with part="snippet,replies" at no extra quota cost. The API
+    embeds up to 5 replies per thread; when those are all of a thread's replies they are
+    returned directly and no separate comments.list call is needed for that thread.
+
     Parameters:
         youtube (Resource): The YouTube API service object
         video_id (str): The video ID to fetch comments from
+        on_thread_with_replies (callable): Optional callback invoked with
+            (parent_comment_id, reply_count) as soon as each page is read, so
+            replies can be fetched while pagination continues
 
     Returns:
-        tuple: (comments_list, threads_with_replies)
+        tuple: (comments_list, threads_with_replies, embedded_sub_comments)
             - comments_list (list of dict): List of comment dictionaries with structure:
               {
                   "youtubeCommentId": "comment_id",
@@ -704,15 +1053,18 @@ def fetch_video_comments(youtube, video_id):
                   "likesCount": 123
               }
             - threads_with_replies (list of tuple): List of (parent_comment_id, reply_count)
-              for comments that have replies
+              for comments whose replies still have to be fetched
+            - embedded_sub_comments (list of dict): Replies taken from the thread responses,
+              structured as in fetch_comment_replies()
 
     Raises:
         googleapiclient.errors.HttpError: For API-related errors (re-raised to caller)
     """
-    from googleapiclient.errors import HttpError
-
     comments_list = []  # Accumulator for all comments
-    threads_with_replies = []  # Track comments that have replies
+    append_comment = comments_list.append  # Bound once for the per-comment loop
+    threads_with_replies = []  # Track comments whose replies must be fetched
+    embedded_sub_comments = []  # Complete reply lists embedded in thread responses
+    list_comment_threads = youtube.commentThreads().list  # Bound once for the pagination loop
     next_page_token = None  # Pagination cursor (None for first page)
 
     try:
@@ -720,46 +1072,56 @@ def fetch_video_comments(youtube, video_id):
         while True:
             # Query the YouTube API for a page of comment threads
             response = api_call_with_retry(
-                lambda: youtube.commentThreads().list(
-                    part="snippet",  # Retrieve comment metadata
-                    videoId=video_id,  # Specify which video to query
-                    maxResults=CONFIG['max_results_comments'],  # Fetch maximum items per page
-                    textFormat="plainText",  # Get plain text without HTML formatting
-                    pageToken=next_page_token  # Pagination cursor (None for first page)
-                ).execute(),
-                operation_type='commentThreads.list'
+                list_comment_threads,
+                operation_type='commentThreads.list',
+                part="snippet,replies",  # Comment metadata plus up to 5 embedded replies
+                videoId=video_id,  # Specify which video to query
+                maxResults=CONFIG['max_results_comments'],  # Fetch maximum items per page
+                textFormat="plainText",  # Get plain text without HTML formatting
+                pageToken=next_page_token,  # Pagination cursor (None for first page)
+                # Partial response: drop author/channel/etag fields we never read
+                fields="nextPageToken,items(snippet(totalReplyCount,"
+                       "topLevelComment(id,snippet(textDisplay,publishedAt,likeCount))),"
+                       "replies/comments(id,snippet(textDisplay,publishedAt,likeCount)))"
             )
 
             # Extract comment data from the current page
             for thread in response['items']:
-                # Navigate to the top-level comment within the thread
+                # Navigate to the top-level comment within the thread once
                 # Structure: thread['snippet']['topLevelComment']['snippet']
-                top_level_comment = thread['snippet']['topLevelComment']['snippet']
+                thread_snippet = thread['snippet']
+                top_level_comment = thread_snippet['topLevelComment']
+                comment_snippet = top_level_comment['snippet']
 
                 # Extract YouTube's unique comment ID for establishing relationships
-                youtube_comment_id = thread['snippet']['topLevelComment']['id']
-
-                # Extract required fields from the comment snippet
-                comment_text = top_level_comment['textDisplay']
-                date_posted = top_level_comment['publishedAt']
-                likes_count = top_level_comment['likeCount']
+                youtube_comment_id = top_level_comment['id']
 
                 # Create comment dictionary with normalized structure
                 # videoId is now a FK reference to the videos table
-                comment_obj = {
+                append_comment({
                     "youtubeCommentId": youtube_comment_id,
                     "videoId": video_id,
-                    "comment": comment_text,
-                    "datePostComment": date_posted,
-                    "likesCount": likes_count
-                }
-                comments_list.append(comment_obj)
+                    "comment": comment_snippet['textDisplay'],
+                    "datePostComment": comment_snippet['publishedAt'],
+                    "likesCount": comment_snippet['likeCount']
+                })
 
                 # Check if this comment has replies
-                # If totalReplyCount > 0, we need to fetch replies separately
-                total_reply_count = thread['snippet']['totalReplyCount']
+                # Use the embedded replies when they are complete; otherwise
+                # they have to be fetched separately
+                total_reply_count = thread_snippet['totalReplyCount']
                 if total_reply_count > 0:
+                    embedded_replies = thread.get('replies', {}).get('comments', [])
+                    if len(embedded_replies) == total_reply_count:
+                        embedded_sub_comments.extend(
+                            build_sub_comment(reply, video_id, youtube_comment_id)
+                            for reply in embedded_replies
+                        )
+                        continue
+
                     threads_with_replies.append((youtube_comment_id, total_reply_count))
+                    if on_thread_with_replies is not None:
+                        on_thread_with_replies(youtube_comment_id, total_reply_count)
 
             # Check if there are more pages to fetch
             # If nextPageToken is absent, we've reached the last page
@@ -767,7 +1129,7 @@ def fetch_video_comments(youtube, video_id):
             if not next_page_token:
                 break  # Exit the loop when no more pages exist
 
-        return comments_list, threads_with_replies
+        return comments_list, threads_with_replies, embedded_sub_comments
 
     except HttpError as e:
         # Re-raise all HTTP errors to be handled by the main loop
@@ -775,6 +1137,36 @@ def fetch_video_comments(youtube, video_id):
         raise
 
 
+def build_sub_comment(reply, video_id, parent_comment_id):
+    """
+    Build a sub-comment dictionary from a reply resource returned by the API.
+
+    Used for replies from comments.list pages and for replies embedded in
+    commentThreads.list responses, which share the same structure.
+
+    Parameters:
+        reply (dict): A comment resource (reply) from the API response
+        video_id (str): The video ID (FK reference to videos table)
+        parent_comment_id (str): The ID of the parent comment
+
+    Returns:
+        dict: Sub-comment dictionary (see fetch_comment_replies())
+    """
+    # Navigate to the reply snippet once
+    # Structure: reply['snippet']
+    reply_snippet = reply['snippet']
+
+    # videoId is a FK reference to the videos table
+    return {
+        "youtubeCommentId": reply['id'],
+        "videoId": video_id,
+        "parentCommentId": parent_comment_id,
+        "subComment": reply_snippet['textDisplay'],
+        "datePostSubComment": reply_snippet['publishedAt'],
+        "likeCount": reply_snippet['likeCount']
+    }
+
+
 def fetch_comment_replies(youtube, parent_comment_id, video_id):
     """
     Retrieve all replies (sub-comments) for a specific parent comment using pagination.
@@ -808,9 +1200,9 @@ def fetch_comment_replies(youtube, parent_comment_id, video_id):
         - "likeCount" (not "likesCount")
         - "videoId" (FK reference, not "videoTitle" or "videoLinkId")
     """
-    from googleapiclient.errors import HttpError
-
     sub_comments_list = []  # Accumulator for all replies
+    append_sub_comment = sub_comments_list.append  # Bound once for the per-reply loop
+    list_comments = youtube.comments().list  # Bound once for the pagination loop
     next_page_token = None  # Pagination cursor (None for first page)
 
     try:
@@ -818,41 +1210,20 @@ def fetch_comment_replies(youtube, parent_comment_id, video_id):
         while True:
             # Query the YouTube API for a page of replies
             response = api_call_with_retry(
-                lambda: youtube.comments().list(
-                    part="snippet",  # Retrieve reply metadata
-                    parentId=parent_comment_id,  # Specify which comment's replies to fetch
-                    maxResults=CONFIG['max_results_comments'],  # Fetch maximum items per page
-                    textFormat="plainText",  # Get plain text without HTML formatting
-                    pageToken=next_page_token  # Pagination cursor (None for first page)
-                ).execute(),
-                operation_type='comments.list'
+                list_comments,
+                operation_type='comments.list',
+                part="snippet",  # Retrieve reply metadata
+                parentId=parent_comment_id,  # Specify which comment's replies to fetch
+                maxResults=CONFIG['max_results_comments'],  # Fetch maximum items per page
+                textFormat="plainText",  # Get plain text without HTML formatting
+                pageToken=next_page_token,  # Pagination cursor (None for first page)
+                # Partial response: drop author/channel/etag fields we never read
+                fields="nextPageToken,items(id,snippet(textDisplay,publishedAt,likeCount))"
             )
 
             # Extract reply data from the current page
             for reply in response['items']:
-                # Navigate to the reply snippet
-                # Structure: reply['snippet']
-                reply_snippet = reply['snippet']
-
-                # Extract YouTube's unique reply ID for this sub-comment
-                youtube_reply_id = reply['id']
-
-                # Extract required fields from the reply snippet
-                sub_comment_text = reply_snippet['textDisplay']
-                date_posted = reply_snippet['publishedAt']
-                like_count = reply_snippet['likeCount']
-
-                # Create sub-comment dictionary with normalized structure
-                # videoId is now a FK reference to the videos table
-                sub_comment_obj = {
-                    "youtubeCommentId": youtube_reply_id,
-                    "videoId": video_id,
-                    "parentCommentId": parent_comment_id,
-                    "subComment": sub_comment_text,
-                    "datePostSubComment": date_posted,
-                    "likeCount": like_count
-                }
-                sub_comments_list.append(sub_comment_obj)
+                append_sub_comment(build_sub_comment(reply, video_id, parent_comment_id))
 
             # Check if there are more pages to fetch
             # If nextPageToken is absent, we've reached the last page
@@ -878,6 +1249,147 @@ def fetch_comment_replies(youtube, parent_comment_id, video_id):
         return []
 
 
+def fetch_thread_replies(parent_comment_id, video_id):
+    """
+    Fetch the replies to one comment on a reply worker thread.
+
+    Thin wrapper around fetch_comment_replies() that uses the calling
+    thread's own YouTube service object (see get_youtube_client()).
+
+    Parameters:
+        parent_comment_id (str): The ID of the parent comment to fetch replies for
+        video_id (str): The video ID (FK reference to videos table)
+
+    Returns:
+        list: Sub-comment dictionaries, as from fetch_comment_replies()
+    """
+    return fetch_comment_replies(get_youtube_client(), parent_comment_id, video_id)
+
+
+def fetch_video_data(reply_executor, video_id, video_title):
+    """
+    Fetch all comments and replies for one video.
+
+    Runs on a worker thread (see iter_video_results()), using that thread's
+    own YouTube service object, so several videos can be fetched at once.
+    The replies of each comment thread are submitted to reply_executor as
+    soon as its comment page arrives, so they download while the remaining
+    comment pages are still being fetched, and are collected in comment order.
+
+    Parameters:
+        reply_executor (ThreadPoolExecutor): Pool running fetch_thread_replies()
+        video_id (str): The video ID to fetch comments from
+        video_title (str): The video title (for reply discrepancy reports)
+
+    Returns:
+        tuple: (comments, sub_comments, failed_reply_fetches)
+            - comments (list of dict): Top-level comments, as from fetch_video_comments()
+            - sub_comments (list of dict): Replies, as from fetch_comment_replies()
+            - failed_reply_fetches (list of dict): Reply count discrepancies for this video
+
+    Raises:
+        googleapiclient.errors.HttpError: If fetching the top-level comments
+            fails, or if a reply fetch runs out of quota
+    """
+    youtube = get_youtube_client()
+    failed_reply_fetches = []
+    reply_futures = []
+
+    def dispatch_replies(parent_comment_id, reply_count):
+        reply_futures.append((
+            parent_comment_id,
+            reply_count,
+            reply_executor.submit(fetch_thread_replies, parent_comment_id, video_id)
+        ))
+
+    # Fetch top-level comments for this video; reply fetches start page by page
+    # for the threads whose replies weren't all embedded in the response
+    try:
+        comments, _, sub_comments = fetch_video_comments(
+            youtube, video_id, on_thread_with_replies=dispatch_replies
+        )
+    except Exception:
+        # Don't spend quota on replies of a video that will be skipped
+        for _, _, reply_future in reply_futures:
+            reply_future.cancel()
+        raise
+
+    for parent_comment_id, reply_count, reply_future in reply_futures:
+        try:
+            replies = reply_future.result()
+            sub_comments.extend(replies)
+
+            # Validate that we fetched all expected replies
+            if len(replies) != reply_count:
+                failed_reply_fetches.append({
+                    'parent_comment_id': parent_comment_id,
+                    'video_id': video_id,
+                    'video_title': video_title,
+                    'expected_count': reply_count,
+                    'fetched_count': len(replies),
+                    'missing_count': reply_count - len(replies)
+                })
+        except Exception as e:
+            if isinstance(e, HttpError) and parse_http_error_reason(e) == 'quotaExceeded':
+                # The video has to be fetched again once quota resets, so it
+                # must not be saved (and marked processed) with replies missing
+                for _, _, pending_future in reply_futures:
+                    pending_future.cancel()
+                raise
+
+            # Track complete fetch failures
+            failed_reply_fetches.append({
+                'parent_comment_id': parent_comment_id,
+                'video_id': video_id,
+                'video_title': video_title,
+                'expected_count': reply_count,
+                'fetched_count': 0,
+                'missing_count': reply_count,
+                'error': str(e)
+            })
+
+    return comments, sub_comments, failed_reply_fetches
+
+
+def iter_video_results(executor, reply_executor, videos):
+    """
+    Fetch videos concurrently and yield their results in playlist order.
+
+    Up to twice the executor's worker count of videos are submitted ahead of
+    the one being consumed, so network round trips for the next videos
+    overlap with saving the current one while pending work stays bounded.
+
+    Parameters:
+        executor (ThreadPoolExecutor): Pool running fetch_video_data()
+        reply_executor (ThreadPoolExecutor): Pool the videos' reply fetches run on
+        videos (list): Video metadata dictionaries to process
+
+    Yields:
+        tuple: (video, future) where future resolves to fetch_video_data()'s result
+    """
+    window = CONFIG['video_workers'] * 2
+    videos = iter(videos)
+    pending = deque()
+
+    def submit_next():
+        video = next(videos, None)
+        if video is not None:
+            pending.append((
+                video,
+                executor.submit(
+                    fetch_video_data, reply_executor, video['youtubeVideoId'], video['title']
+                )
+            ))
+
+    for _ in range(window):
+        submit_next()
+
+    while pending:
+        video, future = pending.popleft()
+        submit_next()
+        yield video, future
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -943,20 +1455,24 @@ For more information, see README.md
         # Step 3: Define File Paths
         # Channel-specific output files for storing videos, comments, and sub-comments
         videos_file = f"{CONFIG['output_dir']}/{channel_id}_videos.json"
-        comments_file = f"{CONFIG['output_dir']}/{channel_id}_comments.json"
-        sub_comments_file = f"{CONFIG['output_dir']}/{channel_id}_sub_comments.json"
+        comments_file = f"{CONFIG['output_dir']}/{channel_id}_comments.jsonl"
+        sub_comments_file = f"{CONFIG['output_dir']}/{channel_id}_sub_comments.jsonl"
+
+        # Comments and sub-comments used to be saved as JSON arrays
+        migrate_json_array_to_jsonl(f"{CONFIG['output_dir']}/{channel_id}_comments.json", comments_file)
+        migrate_json_array_to_jsonl(f"{CONFIG['output_dir']}/{channel_id}_sub_comments.json", sub_comments_file)
 
         # Step 4: Load Existing State
         processed_videos_set, master_videos_list = load_videos_state(videos_file)
-        master_comments_list = load_comments_state(comments_file)
-        master_sub_comments_list = load_sub_comments(sub_comments_file)
+        total_comments = load_jsonl_state(comments_file, processed_videos_set)
+        total_sub_comments = load_jsonl_state(sub_comments_file, processed_videos_set)
 
         # Display resumption status
         if processed_videos_set:
             print(f"Resuming: Found {len(processed_videos_set)} already processed videos")
             print(f"Existing videos: {len(master_videos_list)}")
-            print(f"Existing comments: {len(master_comments_list)}")
-            print(f"Existing sub-comments: {len(master_sub_comments_list)}")
+            print(f"Existing comments: {total_comments}")
+            print(f"Existing sub-comments: {total_sub_comments}")
         else:
             print("Starting fresh: No previous data found")
         print()
@@ -1001,110 +1517,100 @@ For more information, see README.md
             exit(0)
 
         # Step 8: Main Comment Extraction Loop
-        from googleapiclient.errors import HttpError
-
         # Track failed reply fetches for validation
         failed_reply_fetches = []
 
-        for video in tqdm(videos_to_process, desc="Processing videos"):
-            # Extract video ID from video metadata
-            video_id = video['youtubeVideoId']
-            video_title = video['title']
+        # Results are saved every CONFIG['checkpoint_every'] videos (and on
+        # exit) instead of after every video, so the videos file rewrite and
+        # the fsyncs are paid once per checkpoint
+        pending_comments = []
+        pending_sub_comments = []
+        videos_since_save = 0
 
-            # Initialize temporary lists for this video's data
-            new_comments = []
-            new_sub_comments = []
+        # Videos are fetched concurrently on worker threads; results are
+        # consumed (and saved) here in playlist order. Reply fetches go to a
+        # separate pool so video workers waiting on them can't starve it
+        executor = ThreadPoolExecutor(max_workers=CONFIG['video_workers'])
+        reply_executor = ThreadPoolExecutor(max_workers=CONFIG['reply_workers'])
+        video_results = iter_video_results(executor, reply_executor, videos_to_process)
 
-            try:
-                # Fetch top-level comments for this video
-                comments_data, threads_with_replies = fetch_video_comments(
-                    youtube, video_id
-                )
-                new_comments = comments_data
-
-                # Fetch replies for comments that have them
-                for parent_comment_id, reply_count in threads_with_replies:
-                    try:
-                        replies = fetch_comment_replies(
-                            youtube, parent_comment_id, video_id
-                        )
-                        new_sub_comments.extend(replies)
-
-                        # Validate that we fetched all expected replies
-                        if len(replies) != reply_count:
-                            failed_reply_fetches.append({
-                                'parent_comment_id': parent_comment_id,
-                                'video_id': video_id,
-                                'video_title': video_title,
-                                'expected_count': reply_count,
-                                'fetched_count': len(replies),
-                                'missing_count': reply_count - len(replies)
-                            })
-                    except Exception as e:
-                        # Track complete fetch failures
-                        failed_reply_fetches.append({
-                            'parent_comment_id': parent_comment_id,
-                            'video_id': video_id,
-                            'video_title': video_title,
-                            'expected_count': reply_count,
-                            'fetched_count': 0,
-                            'missing_count': reply_count,
-                            'error': str(e)
-                        })
-
-            except HttpError as e:
-                # Check for specific error reasons
-                error_reason = parse_http_error_reason(e)
-
-                if error_reason == 'commentsDisabled':
-                    # Comments are disabled for this video - skip it
-                    # Still add video metadata even if comments are disabled
-                    print(f"Skipping comments for {video_title}: Comments disabled")
-                    # Add channel_id to video metadata and append to master list
-                    video['channelId'] = channel_id
-                    master_videos_list.append(video)
-                    # Save videos file atomically
-                    atomic_write_json(videos_file, master_videos_list)
-                    continue
-
-                elif error_reason == 'quotaExceeded':
-                    # API quota exceeded - stop gracefully
-                    print()
-                    print("=" * 70)
-                    print("⚠️  API quota exceeded. Stopping gracefully...")
-                    print("=" * 70)
-                    print(f"Processed {len(master_videos_list)} videos")
-                    print(f"Processed {len(master_comments_list)} comments and {len(master_sub_comments_list)} sub-comments")
-                    print(f"📊 Quota used: {quota_used} units (of {CONFIG['daily_quota_limit']} daily limit)")
-                    print()
-                    print("Run the script again to resume from where you left off.")
-                    print("Quota resets at midnight Pacific Time (PT).")
-                    print("=" * 70)
-                    break
-
-                else:
-                    # Other HTTP error - log and continue to next video
-                    print(f"Error processing video {video_title}: {e}")
+        try:
+            for video, future in tqdm(video_results, total=len(videos_to_process), desc="Processing videos", mininterval=0.5):
+                # Video title for log messages
+                video_title = video['title']
+
+                try:
+                    new_comments, new_sub_comments, video_failed_replies = future.result()
+                    failed_reply_fetches.extend(video_failed_replies)
+
+                except HttpError as e:
+                    # Check for specific error reasons
+                    error_reason = parse_http_error_reason(e)
+
+                    if error_reason == 'commentsDisabled':
+                        # Comments are disabled for this video - skip it
+                        # Still add video metadata even if comments are disabled
+                        print(f"Skipping comments for {video_title}: Comments disabled")
+                        # Fall through to record the video with no comments
+                        new_comments, new_sub_comments = [], []
+
+                    elif error_reason == 'quotaExceeded':
+                        # API quota exceeded - stop gracefully
+                        print()
+                        print("=" * 70)
+                        print("⚠️  API quota exceeded. Stopping gracefully...")
+                        print("=" * 70)
+                        print(f"Processed {len(master_videos_list)} videos")
+                        print(f"Processed {total_comments} comments and {total_sub_comments} sub-comments")
+                        print(f"📊 Quota used: {quota_used} units (of {CONFIG['daily_quota_limit']} daily limit)")
+                        print()
+                        print("Run the script again to resume from where you left off.")
+                        print("Quota resets at midnight Pacific Time (PT).")
+                        print("=" * 70)
+                        break
+
+                    else:
+                        # Other HTTP error - log and continue to next video
+                        print(f"Error processing video {video_title}: {e}")
+                        continue
+
+                except Exception as e:
+                    # Unexpected error - log and continue to next video
+                    print(f"Error processing video {video_title}: {str(e)}")
                     continue
 
-            except Exception as e:
-                # Unexpected error - log and continue to next video
-                print(f"Error processing video {video_title}: {str(e)}")
-                continue
-
-            # Atomic progress saving after successfully processing this video
-            # Add channel_id to video metadata
-            video['channelId'] = channel_id
-
-            # Extend the master lists with this video's data
-            master_videos_list.append(video)
-            master_comments_list.extend(new_comments)
-            master_sub_comments_list.extend(new_sub_comments)
-
-            # Save all three files atomically
-            atomic_write_json(videos_file, master_videos_list)
-            atomic_write_json(comments_file, master_comments_list)
-            atomic_write_json(sub_comments_file, master_sub_comments_list)
+                # Record this video's data after successfully processing it
+                # Add channel_id to video metadata
+                video['channelId'] = channel_id
+
+                master_videos_list.append(video)
+                pending_comments.extend(new_comments)
+                pending_sub_comments.extend(new_sub_comments)
+                total_comments += len(new_comments)
+                total_sub_comments += len(new_sub_comments)
+
+                # Periodic checkpoint
+                videos_since_save += 1
+                if videos_since_save >= CONFIG['checkpoint_every']:
+                    save_progress(
+                        videos_file, master_videos_list,
+                        comments_file, pending_comments,
+                        sub_comments_file, pending_sub_comments
+                    )
+                    videos_since_save = 0
+        finally:
+            # Drop videos that were queued but not started (quota exceeded or
+            # interrupted) instead of fetching them on the way out
+            executor.shutdown(wait=False, cancel_futures=True)
+            reply_executor.shutdown(wait=False, cancel_futures=True)
+
+            # Save whatever was fetched since the last checkpoint
+            if videos_since_save:
+                save_progress(
+                    videos_file, master_videos_list,
+                    comments_file, pending_comments,
+                    sub_comments_file, pending_sub_comments
+                )
 
         # Step 9: Save Failed Reply Fetches (if any)
         if failed_reply_fetches:
@@ -1120,8 +1626,8 @@ For more information, see README.md
         print("Processing complete!")
         print("=" * 70)
         print(f"Total videos extracted: {len(master_videos_list)}")
-        print(f"Total comments extracted: {len(master_comments_list)}")
-        print(f"Total sub-comments extracted: {len(master_sub_comments_list)}")
+        print(f"Total comments extracted: {total_comments}")
+        print(f"Total sub-comments extracted: {total_sub_comments}")
         print(f"Data saved to:")
         print(f"  - Videos: {videos_file}")
         print(f"  - Comments: {comments_file}")